@@ -3,30 +3,55 @@
 from __future__ import annotations
 
 import logging
+import random
 import time
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Final
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
+import orjson
+from bleak import BLEDevice
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+    async_ble_device_from_address,
+    async_register_callback,
+    async_track_unavailable,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
 from .const import DOMAIN
-from .micro_air_easytouch.const import UUIDS
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
-from .services import async_register_services, async_unregister_services
+from .services import async_register_services
 
 PLATFORMS: Final = [Platform.BUTTON, Platform.CLIMATE, Platform.SENSOR]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 _LOGGER = logging.getLogger(__name__)
 
 # Update interval for coordinator - poll every 2 minutes
 UPDATE_INTERVAL = timedelta(seconds=120)
 
+# Back off polling once the device has been missing for this many polls
+BACKOFF_AFTER_FAILURES = 3
+MAX_BACKOFF_INTERVAL = timedelta(seconds=600)
+# After this many misses treat it as a long outage and poll hourly
+LONG_OUTAGE_FAILURES = 8
+LONG_OUTAGE_INTERVAL = timedelta(hours=1)
+
+# Coalesce refresh requests from back-to-back commands into one poll
+REQUEST_REFRESH_COOLDOWN = 1.0
+
 
 class MicroAirEasyTouchCoordinator(DataUpdateCoordinator):
     """Coordinator to manage single Bluetooth connection for all entities."""
@@ -44,48 +69,123 @@ class MicroAirEasyTouchCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{address}",
             update_interval=UPDATE_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
+            # Skip entity state writes when a poll returns identical data
+            always_update=False,
         )
         self._data = data
         self._address = address
         self._zone = zone
+        self._ble_device: BLEDevice | None = None
+        self._consecutive_misses = 0
+        # Only TM changes between polls, so build the request once
+        self._status_request = {
+            "Type": "Get Status",
+            "Zone": zone,
+            "EM": data._email,
+            "TM": 0,
+        }
+
+    def get_ble_device(self) -> BLEDevice | None:
+        """Return the cached BLE device, resolving it on a cache miss."""
+        if self._ble_device is None:
+            self._ble_device = async_ble_device_from_address(
+                self.hass, self._address
+            )
+        return self._ble_device
+
+    @callback
+    def invalidate_ble_device(self) -> None:
+        """Drop the cached BLE device so the next lookup resolves it again."""
+        self._ble_device = None
+
+    @callback
+    def async_device_seen(self, ble_device: BLEDevice) -> None:
+        """Cache an advertised device and end any backoff right away."""
+        self._ble_device = ble_device
+        if self.update_interval != UPDATE_INTERVAL:
+            # Device is back in range, poll now instead of at backoff expiry
+            self.update_interval = UPDATE_INTERVAL
+            # Same debounced path as async_request_refresh, callable from
+            # this synchronous callback without spawning a task
+            self._debounced_refresh.async_schedule_call()
 
     async def _async_update_data(self) -> dict:
-        """Fetch data from the device using a single Bluetooth connection."""
+        """Fetch data, backing off while the device cannot be found."""
         ble_device = async_ble_device_from_address(self.hass, self._address)
         if not ble_device:
+            self._consecutive_misses += 1
+            if self._consecutive_misses > LONG_OUTAGE_FAILURES:
+                self.update_interval = LONG_OUTAGE_INTERVAL * random.uniform(
+                    0.8, 1.2
+                )
+            elif self._consecutive_misses > BACKOFF_AFTER_FAILURES:
+                # Double from the base interval for each miss past the
+                # threshold. Jitter keeps instances recovering from a shared
+                # adapter reset from retrying in lockstep
+                steps = self._consecutive_misses - BACKOFF_AFTER_FAILURES
+                self.update_interval = min(
+                    MAX_BACKOFF_INTERVAL, UPDATE_INTERVAL * 2**steps
+                ) * random.uniform(0.5, 1.5)
             raise UpdateFailed(f"Could not find BLE device: {self._address}")
-
-        message = {
-            "Type": "Get Status",
-            "Zone": self._zone,
-            "EM": self._data._email,
-            "TM": int(time.time()),
-        }
+        # Only polls that miss the device count toward backoff, a device in
+        # range that fails an exchange keeps the normal interval
+        self._consecutive_misses = 0
+        self._ble_device = ble_device
+        self.update_interval = UPDATE_INTERVAL
+        return await self._async_fetch_state(ble_device)
+
+    async def _async_fetch_state(self, ble_device: BLEDevice) -> dict:
+        """Fetch data from the device using a single Bluetooth connection."""
+        # Device expects Unix wall-clock time, so the event loop's
+        # monotonic clock cannot be used here
+        self._status_request["TM"] = time.time_ns() // 1_000_000_000
+        message = orjson.dumps(self._status_request)
 
         try:
-            if await self._data.send_command(self.hass, ble_device, message):
-                json_payload = await self._data._read_gatt_with_retry(
-                    self.hass, UUIDS["jsonReturn"], ble_device
-                )
-                if json_payload:
-                    new_state = self._data.decrypt(
-                        json_payload.decode("utf-8"), zone=self._zone
+            sent, json_payload = await self._data.send_command_and_read(
+                self.hass, ble_device, message
+            )
+            if not sent:
+                raise UpdateFailed("Failed to send status request to device")
+            if json_payload:
+                new_state = self._data.decrypt(json_payload, zone=self._zone)
+                if new_state:
+                    _LOGGER.debug(
+                        "Coordinator fetched state for zone %s",
+                        self._zone,
                     )
-                    if new_state:
-                        _LOGGER.debug(
-                            "Coordinator fetched state for zone %s",
-                            self._zone,
-                        )
-                        return new_state
-                    raise UpdateFailed("Failed to decrypt device data")
-                raise UpdateFailed("No payload received from device")
-            raise UpdateFailed("Failed to send command to device")
+                    return new_state
+                raise UpdateFailed("Failed to decrypt device data")
+            raise UpdateFailed("No payload received from device")
         except Exception as err:
             raise UpdateFailed(
                 f"Error communicating with device: {err}"
             ) from err
 
 
+@dataclass
+class MicroAirEasyTouchRuntimeData:
+    """Runtime data stored on the config entry."""
+
+    data: MicroAirEasyTouchBluetoothDeviceData
+    coordinator: MicroAirEasyTouchCoordinator
+    # Formatted LAT/LON last accepted by the device, see set_location
+    last_location: tuple[str, str] | None = None
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MicroAirEasyTouch integration."""
+    # Services are shared by all devices, so register them once
+    await async_register_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MicroAirEasyTouch from a config entry."""
     address = entry.unique_id
@@ -100,13 +200,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        "data": data,
-        "coordinator": coordinator,
-    }
+    entry.runtime_data = MicroAirEasyTouchRuntimeData(
+        data=data, coordinator=coordinator
+    )
 
-    # Register services (only once, even with multiple devices)
-    await async_register_services(hass)
+    @callback
+    def _handle_bluetooth_update(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Track the BLE device from a matching advertisement."""
+        # Keep the cached BLE device on the freshest connection path
+        coordinator.async_device_seen(service_info.device)
+
+    # Only advertisements from this thermostat are dispatched to us
+    entry.async_on_unload(
+        async_register_callback(
+            hass,
+            _handle_bluetooth_update,
+            BluetoothCallbackMatcher(address=address),
+            BluetoothScanningMode.PASSIVE,
+        )
+    )
+
+    @callback
+    def _handle_unavailable(service_info: BluetoothServiceInfoBleak) -> None:
+        """Forget the BLE device once the scanner stops seeing it."""
+        _LOGGER.debug("Device %s is no longer seen", service_info.address)
+        coordinator.invalidate_ble_device()
+
+    entry.async_on_unload(
+        async_track_unavailable(
+            hass, _handle_unavailable, address, connectable=True
+        )
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -117,8 +243,5 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS
     ):
-        hass.data[DOMAIN].pop(entry.entry_id)
-        # Unregister services only when the last config entry is removed
-        if not hass.data[DOMAIN]:
-            await async_unregister_services(hass)
+        await entry.runtime_data.data.async_close()
     return unload_ok
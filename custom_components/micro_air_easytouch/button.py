@@ -4,14 +4,13 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from . import MicroAirEasyTouchCoordinator
+from .device import device_info_for
 from .micro_air_easytouch.parser import (  # Corrected import
     MicroAirEasyTouchBluetoothDeviceData,
 )
@@ -25,36 +24,39 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MicroAirEasyTouch button based on a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]["data"]
+    runtime_data = config_entry.runtime_data
     mac_address = config_entry.unique_id
     assert mac_address is not None
-    async_add_entities([MicroAirEasyTouchRebootButton(data, mac_address)])
+    async_add_entities(
+        [
+            MicroAirEasyTouchRebootButton(
+                runtime_data.data, runtime_data.coordinator, mac_address
+            )
+        ]
+    )
 
 
 class MicroAirEasyTouchRebootButton(ButtonEntity):
     """Representation of a reboot button for MicroAirEasyTouch."""
 
     def __init__(
-        self, data: MicroAirEasyTouchBluetoothDeviceData, mac_address: str
+        self,
+        data: MicroAirEasyTouchBluetoothDeviceData,
+        coordinator: MicroAirEasyTouchCoordinator,
+        mac_address: str,
     ) -> None:
         """Initialize the button."""
         self._data = data
+        self._coordinator = coordinator
         self._mac_address = mac_address
         self._attr_unique_id = f"microaireasytouch_{self._mac_address}_reboot"
         self._attr_name = "Reboot Device"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"MicroAirEasyTouch_{self._mac_address}")},
-            name=f"EasyTouch {self._mac_address}",
-            manufacturer="Micro-Air",
-            model="Thermostat",
-        )
+        self._attr_device_info = device_info_for(self._mac_address)
 
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.debug("Reboot button pressed")
-        ble_device = async_ble_device_from_address(
-            self.hass, self._mac_address
-        )
+        ble_device = self._coordinator.get_ble_device()
         if not ble_device:
             _LOGGER.error(
                 "Could not find BLE device for reboot: %s", self._mac_address
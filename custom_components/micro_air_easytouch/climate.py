@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Final
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -15,21 +16,23 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .device import device_info_for
 from .micro_air_easytouch.const import (
     EASY_MODE_TO_HA_MODE,
-    FAN_MODES_FAN_ONLY_REVERSE,
-    FAN_MODES_REVERSE,
+    HA_MODE_LIST,
     HA_MODE_TO_EASY_MODE,
 )
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Changes made within this many seconds are merged into one command
+CHANGE_BATCH_DELAY = 0.5
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,8 +40,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MicroAirEasyTouch climate platform."""
-    data = hass.data[DOMAIN][config_entry.entry_id]["data"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    data = config_entry.runtime_data.data
+    coordinator = config_entry.runtime_data.coordinator
     mac_address = config_entry.unique_id
 
     # Create a single climate entity for zone 0
@@ -59,47 +62,108 @@ class MicroAirEasyTouchClimate(CoordinatorEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
     )
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
-    _attr_hvac_modes = list(HA_MODE_TO_EASY_MODE.keys())
+    _attr_hvac_modes = HA_MODE_LIST
+
+    # Available fan modes as standard Home Assistant names
+    _FAN_MODES_FAN_ONLY: Final = ("off", "low", "high")
+    _FAN_MODES_ALL: Final = ("off", "low", "high", "auto")
 
     # Map our modes to Home Assistant fan icons
-    _FAN_MODE_ICONS = {
-        "off": "mdi:fan-off",
-        "low": "mdi:fan-speed-1",
-        "high": "mdi:fan-speed-3",
-        "manualL": "mdi:fan-speed-1",
-        "manualH": "mdi:fan-speed-3",
-        "cycledL": "mdi:fan-clock",
-        "cycledH": "mdi:fan-clock",
-        "full auto": "mdi:fan-auto",
-    }
+    _FAN_MODE_ICONS: Final = MappingProxyType(
+        {
+            "off": "mdi:fan-off",
+            "low": "mdi:fan-speed-1",
+            "high": "mdi:fan-speed-3",
+            "manualL": "mdi:fan-speed-1",
+            "manualH": "mdi:fan-speed-3",
+            "cycledL": "mdi:fan-clock",
+            "cycledH": "mdi:fan-clock",
+            "full auto": "mdi:fan-auto",
+        }
+    )
 
     # Map HVAC modes to icons
-    _HVAC_MODE_ICONS = {
-        HVACMode.OFF: "mdi:power",
-        HVACMode.HEAT: "mdi:fire",
-        HVACMode.COOL: "mdi:snowflake",
-        HVACMode.AUTO: "mdi:autorenew",
-        HVACMode.FAN_ONLY: "mdi:fan",
-        HVACMode.DRY: "mdi:water-percent",
-    }
-
-    # Map device fan modes to Home Assistant standard names
-    _FAN_MODE_MAP = {
-        "off": "off",
-        "low": "low",
-        "manualL": "low",
-        "cycledL": "low",
-        "high": "high",
-        "manualH": "high",
-        "cycledH": "high",
-        "full auto": "auto",
-    }
-    _FAN_MODE_REVERSE_MAP = {
-        "off": [0],
-        "low": [1, 65],
-        "high": [2, 66],
-        "auto": [128],
-    }
+    _HVAC_MODE_ICONS: Final = MappingProxyType(
+        {
+            HVACMode.OFF: "mdi:power",
+            HVACMode.HEAT: "mdi:fire",
+            HVACMode.COOL: "mdi:snowflake",
+            HVACMode.AUTO: "mdi:autorenew",
+            HVACMode.FAN_ONLY: "mdi:fan",
+            HVACMode.DRY: "mdi:water-percent",
+        }
+    )
+
+    # Map device fan numbers straight to Home Assistant standard names
+    _FAN_NUM_TO_STD: Final = MappingProxyType(
+        {
+            0: "off",
+            1: "low",  # manualL
+            65: "low",  # cycledL
+            2: "high",  # manualH
+            66: "high",  # cycledH
+            128: "auto",  # full auto
+        }
+    )
+    # Fan-only mode only knows off/low/high, anything else reads as off
+    _FAN_NUM_TO_STD_FAN_ONLY: Final = MappingProxyType(
+        {0: "off", 1: "low", 2: "high"}
+    )
+
+    # Per-mode (state key, default fan number, name table, unknown name)
+    _FAN_MODE_SPEC: Final = MappingProxyType(
+        {
+            HVACMode.FAN_ONLY: (
+                "fan_mode_num",
+                0,
+                _FAN_NUM_TO_STD_FAN_ONLY,
+                "off",
+            ),
+            HVACMode.COOL: ("cool_fan_mode_num", 128, _FAN_NUM_TO_STD, "auto"),
+            HVACMode.HEAT: ("heat_fan_mode_num", 128, _FAN_NUM_TO_STD, "auto"),
+            HVACMode.AUTO: ("auto_fan_mode_num", 128, _FAN_NUM_TO_STD, "auto"),
+            HVACMode.DRY: ("dry_fan_mode_num", 128, _FAN_NUM_TO_STD, "auto"),
+        }
+    )
+
+    # HVAC action for each running mode reported by the device
+    _ACTION_BY_CURRENT_MODE: Final = MappingProxyType(
+        {
+            "fan": HVACAction.FAN,
+            "cool": HVACAction.COOLING,
+            "cool_on": HVACAction.COOLING,
+            "heat": HVACAction.HEATING,
+            "heat_on": HVACAction.HEATING,
+            "dry": HVACAction.DRYING,
+        }
+    )
+
+    # Change keys used to set the single setpoint for each mode
+    _TEMP_KEY_BY_MODE: Final = MappingProxyType(
+        {
+            HVACMode.COOL: "cool_sp",
+            HVACMode.HEAT: "heat_sp",
+            HVACMode.DRY: "dry_sp",
+        }
+    )
+
+    # Device fan values for standard names (unknown: off / full auto)
+    _FAN_VALUE_FAN_ONLY: Final = MappingProxyType(
+        {"off": 0, "low": 1, "high": 2}
+    )
+    _FAN_VALUE_NORMAL: Final = MappingProxyType(
+        {"off": 0, "low": 1, "high": 2, "auto": 128}
+    )
+
+    # Change keys used to set the fan for each mode
+    _FAN_CHANGE_KEY: Final = MappingProxyType(
+        {
+            HVACMode.COOL: "coolFan",
+            HVACMode.HEAT: "heatFan",
+            HVACMode.AUTO: "autoFan",
+            HVACMode.DRY: "dryFan",
+        }
+    )
 
     def __init__(
         self,
@@ -119,12 +183,65 @@ class MicroAirEasyTouchClimate(CoordinatorEntity, ClimateEntity):
         self._attr_name = "EasyTouch Climate"
         self._last_hvac_mode: HVACMode = HVACMode.COOL
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"MicroAirEasyTouch_{mac_address}")},
-            name=f"EasyTouch {mac_address}",
-            manufacturer="Micro-Air",
-            model="Thermostat",
-        )
+        self._attr_device_info = device_info_for(mac_address)
+        self._pending_changes: dict = {}
+        self._unsub_flush = None
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Derive entity state from the latest coordinator data."""
+        data = self.coordinator.data or {}
+        mode = EASY_MODE_TO_HA_MODE.get(data.get("mode_num", 0), HVACMode.OFF)
+        self._cached_mode = mode
+        self._cached_current_temp = data.get("facePlateTemperature")
+
+        # Targets are (single, high, low) for the active mode
+        temp_key = self._TEMP_KEY_BY_MODE.get(mode)
+        if temp_key is not None:
+            self._cached_targets = (data.get(temp_key), None, None)
+        elif mode == HVACMode.AUTO:
+            self._cached_targets = (
+                None,
+                data.get("autoCool_sp"),
+                data.get("autoHeat_sp"),
+            )
+        else:
+            self._cached_targets = (None, None, None)
+
+        self._cached_fan_mode = self._compute_fan_mode(data, mode)
+        self._cached_action = self._compute_action(data, mode)
+
+    def _compute_fan_mode(self, data: dict, mode: HVACMode) -> str:
+        """Return the fan mode for the given data as a standard name."""
+        spec = self._FAN_MODE_SPEC.get(mode)
+        if spec is None:
+            return "auto"
+        key, default, names, unknown = spec
+        return names.get(data.get(key, default), unknown)
+
+    def _compute_action(self, data: dict, mode: HVACMode) -> HVACAction:
+        """Return the HVAC action for the given data."""
+        if mode == HVACMode.OFF:
+            return HVACAction.OFF
+        current_mode = data.get("current_mode")
+        action = self._ACTION_BY_CURRENT_MODE.get(current_mode)
+        if action is not None:
+            return action
+        if current_mode == "auto":
+            # In auto mode, determine action based on temperature
+            current_temp = self._cached_current_temp
+            _, high, low = self._cached_targets
+            if (
+                current_temp is not None
+                and low is not None
+                and high is not None
+            ):
+                if current_temp < low:
+                    return HVACAction.HEATING
+                elif current_temp > high:
+                    return HVACAction.COOLING
+            return HVACAction.IDLE
+        return HVACAction.IDLE
 
     @property
     def icon(self) -> str:
@@ -146,42 +263,32 @@ class MicroAirEasyTouchClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.coordinator.data.get("facePlateTemperature")
+        return self._cached_current_temp
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        if self.hvac_mode == HVACMode.COOL:
-            return self.coordinator.data.get("cool_sp")
-        elif self.hvac_mode == HVACMode.HEAT:
-            return self.coordinator.data.get("heat_sp")
-        elif self.hvac_mode == HVACMode.DRY:
-            return self.coordinator.data.get("dry_sp")
-        return None
+        return self._cached_targets[0]
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the high target temperature."""
-        if self.hvac_mode == HVACMode.AUTO:
-            return self.coordinator.data.get("autoCool_sp")
-        return None
+        return self._cached_targets[1]
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the low target temperature."""
-        if self.hvac_mode == HVACMode.AUTO:
-            return self.coordinator.data.get("autoHeat_sp")
-        return None
+        return self._cached_targets[2]
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation mode."""
-        mode_num = self.coordinator.data.get("mode_num", 0)
-        return EASY_MODE_TO_HA_MODE.get(mode_num, HVACMode.OFF)
+        return self._cached_mode
 
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update and track the last active HVAC mode."""
-        mode = self.hvac_mode
+        self._update_cached_state()
+        mode = self._cached_mode
         if mode != HVACMode.OFF:
             self._last_hvac_mode = mode
         super()._handle_coordinator_update()
@@ -189,90 +296,82 @@ class MicroAirEasyTouchClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current HVAC action."""
-        current_mode = self.coordinator.data.get("current_mode")
-        if self.hvac_mode == HVACMode.OFF:
-            return HVACAction.OFF
-        elif current_mode == "fan":
-            return HVACAction.FAN
-        elif current_mode in ["cool", "cool_on"]:
-            return HVACAction.COOLING
-        elif current_mode in ["heat", "heat_on"]:
-            return HVACAction.HEATING
-        elif current_mode == "dry":
-            return HVACAction.DRYING
-        elif current_mode == "auto":
-            # In auto mode, determine action based on temperature
-            current_temp = self.current_temperature
-            low = self.target_temperature_low
-            high = self.target_temperature_high
-            if (
-                current_temp is not None
-                and low is not None
-                and high is not None
-            ):
-                if current_temp < low:
-                    return HVACAction.HEATING
-                elif current_temp > high:
-                    return HVACAction.COOLING
-            return HVACAction.IDLE
-        return HVACAction.IDLE
+        return self._cached_action
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode as a standard Home Assistant name."""
-        if self.hvac_mode == HVACMode.FAN_ONLY:
-            fan_mode_num = self.coordinator.data.get("fan_mode_num", 0)
-            mode = FAN_MODES_FAN_ONLY_REVERSE.get(fan_mode_num, "off")
-        elif self.hvac_mode == HVACMode.COOL:
-            fan_mode_num = self.coordinator.data.get("cool_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        elif self.hvac_mode == HVACMode.HEAT:
-            fan_mode_num = self.coordinator.data.get("heat_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        elif self.hvac_mode == HVACMode.AUTO:
-            fan_mode_num = self.coordinator.data.get("auto_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        elif self.hvac_mode == HVACMode.DRY:
-            fan_mode_num = self.coordinator.data.get("dry_fan_mode_num", 128)
-            mode = FAN_MODES_REVERSE.get(fan_mode_num, "full auto")
-        else:
-            mode = "full auto"
-        return self._FAN_MODE_MAP.get(mode, "auto")
+        return self._cached_fan_mode
 
     @property
-    def fan_modes(self) -> list[str]:
+    def fan_modes(self) -> tuple[str, ...]:
         """Return available fan modes as standard Home Assistant names."""
         if self.hvac_mode == HVACMode.FAN_ONLY:
-            return ["off", "low", "high"]
-        return ["off", "low", "high", "auto"]
+            return self._FAN_MODES_FAN_ONLY
+        return self._FAN_MODES_ALL
 
-    async def async_set_temperature(self, **kwargs: Any) -> None:
-        """Set new target temperature."""
-        ble_device = async_ble_device_from_address(
-            self.hass, self._mac_address
-        )
+    async def _send_change(self, changes: dict) -> bool:
+        """Send a Change command to the device."""
+        ble_device = self.coordinator.get_ble_device()
         if not ble_device:
             _LOGGER.error("Could not find BLE device")
-            return
+            return False
+
+        message = {"Type": "Change", "Changes": changes}
+        if not await self._data.send_command(self.hass, ble_device, message):
+            # The cached device may be on a stale path, resolve it next time
+            self.coordinator.invalidate_ble_device()
+            return False
+        return True
+
+    def _target_hvac_mode(self) -> HVACMode:
+        """Return the queued HVAC mode, else the last polled one."""
+        # A mode change may still be waiting in the batch, so keys picked
+        # for follow-up edits must match it rather than the last poll
+        queued = self._pending_changes.get("mode")
+        if queued is None:
+            return self.hvac_mode
+        return EASY_MODE_TO_HA_MODE.get(queued, self.hvac_mode)
+
+    async def _apply_change(self, changes: dict) -> None:
+        """Queue changes so a burst of edits is sent as one command."""
+        self._pending_changes.update(changes)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, CHANGE_BATCH_DELAY, self._async_flush_changes
+            )
+
+    async def _async_flush_changes(self, _now: datetime) -> None:
+        """Send all queued changes in a single Change command."""
+        self._unsub_flush = None
+        changes, self._pending_changes = self._pending_changes, {}
+        if changes and await self._send_change(changes):
+            # The debouncer only arms a timer, so this does not wait on a poll
+            await self.coordinator.async_request_refresh()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Send a pending change batch before the entity is removed."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        changes, self._pending_changes = self._pending_changes, {}
+        # Edits made just before a reload would otherwise be lost. No
+        # refresh is requested, the coordinator is going away with us
+        if changes and not await self._send_change(changes):
+            _LOGGER.warning("Discarded unsent changes on removal: %s", changes)
+        await super().async_will_remove_from_hass()
 
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set new target temperature."""
         changes = {"zone": self._zone, "power": 1}
         if ATTR_TEMPERATURE in kwargs:
-            temp = int(kwargs[ATTR_TEMPERATURE])
-            if self.hvac_mode == HVACMode.COOL:
-                changes["cool_sp"] = temp
-            elif self.hvac_mode == HVACMode.HEAT:
-                changes["heat_sp"] = temp
-            elif self.hvac_mode == HVACMode.DRY:
-                changes["dry_sp"] = temp
+            temp_key = self._TEMP_KEY_BY_MODE.get(self._target_hvac_mode())
+            if temp_key is not None:
+                changes[temp_key] = int(kwargs[ATTR_TEMPERATURE])
         elif "target_temp_high" in kwargs and "target_temp_low" in kwargs:
             changes["autoCool_sp"] = int(kwargs["target_temp_high"])
             changes["autoHeat_sp"] = int(kwargs["target_temp_low"])
-
-        if changes:
-            message = {"Type": "Change", "Changes": changes}
-            if await self._data.send_command(self.hass, ble_device, message):
-                # Request coordinator refresh after successful command
-                await self.coordinator.async_request_refresh()
+        await self._apply_change(changes)
 
     async def async_turn_on(self) -> None:
         """Turn the entity on, restoring the last active HVAC mode."""
@@ -284,74 +383,30 @@ class MicroAirEasyTouchClimate(CoordinatorEntity, ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
-        ble_device = async_ble_device_from_address(
-            self.hass, self._mac_address
-        )
-        if not ble_device:
-            _LOGGER.error("Could not find BLE device")
-            return
-
         mode = HA_MODE_TO_EASY_MODE.get(hvac_mode)
-        if mode is not None:
-            message = {
-                "Type": "Change",
-                "Changes": {
-                    "zone": self._zone,
-                    "power": 0 if hvac_mode == HVACMode.OFF else 1,
-                    "mode": mode,
-                },
+        if mode is None:
+            return
+        await self._apply_change(
+            {
+                "zone": self._zone,
+                "power": 0 if hvac_mode == HVACMode.OFF else 1,
+                "mode": mode,
             }
-            if await self._data.send_command(self.hass, ble_device, message):
-                # Request coordinator refresh after successful command
-                await self.coordinator.async_request_refresh()
+        )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode using standard Home Assistant names."""
-        ble_device = async_ble_device_from_address(
-            self.hass, self._mac_address
-        )
-        if not ble_device:
-            _LOGGER.error("Could not find BLE device")
+        # Map standard name to device value
+        hvac_mode = self._target_hvac_mode()
+        if hvac_mode == HVACMode.FAN_ONLY:
+            fan_value = self._FAN_VALUE_FAN_ONLY.get(fan_mode, 0)
+            await self._apply_change(
+                {"zone": self._zone, "fanOnly": fan_value}
+            )
             return
 
-        # Map standard name to device value
-        if self.hvac_mode == HVACMode.FAN_ONLY:
-            if fan_mode == "off":
-                fan_value = 0
-            elif fan_mode == "low":
-                fan_value = 1
-            elif fan_mode == "high":
-                fan_value = 2
-            else:
-                fan_value = 0
-            message = {
-                "Type": "Change",
-                "Changes": {"zone": self._zone, "fanOnly": fan_value},
-            }
-            if await self._data.send_command(self.hass, ble_device, message):
-                # Request coordinator refresh after successful command
-                await self.coordinator.async_request_refresh()
-        else:
-            if fan_mode == "off":
-                fan_value = 0
-            elif fan_mode == "low":
-                fan_value = 1  # manualL
-            elif fan_mode == "high":
-                fan_value = 2  # manualH
-            elif fan_mode == "auto":
-                fan_value = 128  # full auto
-            else:
-                fan_value = 128
-            changes = {"zone": self._zone}
-            if self.hvac_mode == HVACMode.COOL:
-                changes["coolFan"] = fan_value
-            elif self.hvac_mode == HVACMode.HEAT:
-                changes["heatFan"] = fan_value
-            elif self.hvac_mode == HVACMode.AUTO:
-                changes["autoFan"] = fan_value
-            elif self.hvac_mode == HVACMode.DRY:
-                changes["dryFan"] = fan_value
-            message = {"Type": "Change", "Changes": changes}
-            if await self._data.send_command(self.hass, ble_device, message):
-                # Request coordinator refresh after successful command
-                await self.coordinator.async_request_refresh()
+        changes = {"zone": self._zone}
+        fan_key = self._FAN_CHANGE_KEY.get(hvac_mode)
+        if fan_key is not None:
+            changes[fan_key] = self._FAN_VALUE_NORMAL.get(fan_mode, 128)
+        await self._apply_change(changes)
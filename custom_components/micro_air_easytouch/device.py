@@ -0,0 +1,20 @@
+"""Shared device helpers for MicroAirEasyTouch entities."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN
+
+
+@lru_cache(maxsize=8)
+def device_info_for(mac_address: str) -> DeviceInfo:
+    """Return the DeviceInfo shared by all entities of a thermostat."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"MicroAirEasyTouch_{mac_address}")},
+        name=f"EasyTouch {mac_address}",
+        manufacturer="Micro-Air",
+        model="Thermostat",
+    )
@@ -7,9 +7,9 @@ from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
+from homeassistant.helpers import entity_registry as er
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,12 +21,28 @@ TO_REDACT = {
     "username",
 }
 
+# Data points tracked by the parser, logged with each diagnostics request
+_SCHEMA_DOC = """\
+Available data in parser:
+  - Temperature setpoints: autoHeat_sp, autoCool_sp, cool_sp, heat_sp, dry_sp
+  - Fan modes: fan_mode_num, cool_fan_mode_num, heat_fan_mode_num,
+               auto_fan_mode_num, dry_fan_mode_num
+  - Modes: mode_num (setpoint), current_mode_num (actual)
+  - Temperature: facePlateTemperature
+  - Power state: param[7]=off, param[15]=on
+  - Raw info array indices:
+      [0]=autoHeat_sp, [1]=autoCool_sp, [2]=cool_sp, [3]=heat_sp
+      [4]=dry_sp, [5]=dry_fan, [6]=fan_mode, [7]=cool_fan
+      [8]=unknown, [9]=auto_fan, [10]=mode_num, [11]=heat_fan
+      [12]=temperature, [13-14]=unknown, [15]=current_mode_num
+      [16+]=unknown (if present)"""
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]["data"]
+    data = entry.runtime_data.data
 
     diagnostics_data = {
         "entry": {
@@ -37,18 +53,21 @@ async def async_get_config_entry_diagnostics(
         "raw_data": {},
     }
 
-    # Try to get the current state from climate entity
-    for state in hass.states.async_all():
-        entity_id = state.entity_id
-        if (
-            entity_id.startswith("climate.")
-            and entry.entry_id in entity_id
-            or f"microaireasytouch_{entry.unique_id}" in entity_id
-        ):
-            diagnostics_data["device_state"][entity_id] = {
-                "state": state.state,
-                "attributes": dict(state.attributes),
-            }
+    # Get the climate entity state from the registry. Sensor states are
+    # left out, the serial number sensor's state would bypass redaction
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if entity_entry.domain != Platform.CLIMATE:
+            continue
+        state = hass.states.get(entity_entry.entity_id)
+        if state is None:
+            continue
+        diagnostics_data["device_state"][entity_entry.entity_id] = {
+            "state": state.state,
+            "attributes": dict(state.attributes),
+        }
 
     # Get raw device data if available
     if hasattr(data, "_client") and data._client:
@@ -57,31 +76,7 @@ async def async_get_config_entry_diagnostics(
         )
 
     # Log information about what data points are being tracked
-    _LOGGER.info("=== MicroAir EasyTouch Diagnostics ===")
-    _LOGGER.info("Available data in parser:")
-    _LOGGER.info(
-        "  - Temperature setpoints: autoHeat_sp, autoCool_sp, cool_sp, heat_sp, dry_sp"
-    )
-    _LOGGER.info(
-        "  - Fan modes: fan_mode_num, cool_fan_mode_num, heat_fan_mode_num,"
-    )
-    _LOGGER.info("               auto_fan_mode_num, dry_fan_mode_num")
-    _LOGGER.info("  - Modes: mode_num (setpoint), current_mode_num (actual)")
-    _LOGGER.info("  - Temperature: facePlateTemperature")
-    _LOGGER.info("  - Power state: param[7]=off, param[15]=on")
-    _LOGGER.info("  - Raw info array indices:")
-    _LOGGER.info(
-        "      [0]=autoHeat_sp, [1]=autoCool_sp, [2]=cool_sp, [3]=heat_sp"
-    )
-    _LOGGER.info("      [4]=dry_sp, [5]=dry_fan, [6]=fan_mode, [7]=cool_fan")
-    _LOGGER.info(
-        "      [8]=unknown, [9]=auto_fan, [10]=mode_num, [11]=heat_fan"
-    )
-    _LOGGER.info(
-        "      [12]=temperature, [13-14]=unknown, [15]=current_mode_num"
-    )
-    _LOGGER.info("      [16+]=unknown (if present)")
-    _LOGGER.info("=====================================")
+    _LOGGER.debug("MicroAir EasyTouch parser schema:\n%s", _SCHEMA_DOC)
 
     return async_redact_data(diagnostics_data, TO_REDACT)
 
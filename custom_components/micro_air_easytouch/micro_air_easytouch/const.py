@@ -1,5 +1,7 @@
 """Constants for MicroAirEasyTouch parser"""
 
+from typing import Final
+
 from homeassistant.components.climate import HVACMode
 
 DOMAIN = "micro_air_easytouch"
@@ -21,6 +23,8 @@ HA_MODE_TO_EASY_MODE = {
     HVACMode.DRY: 6,
     HVACMode.AUTO: 11,
 }
+# Supported Home Assistant HVAC modes, frozen once at import
+HA_MODE_LIST: Final = tuple(HA_MODE_TO_EASY_MODE)
 # Map device modes to Home Assistant HVAC modes
 # Includes both setpoint modes and running modes (cool_on=3, heat_on=5)
 EASY_MODE_TO_HA_MODE = {
@@ -48,5 +52,3 @@ FAN_MODES_FAN_ONLY = {
     "low": 1,  # manualL
     "high": 2,  # manualH
 }
-FAN_MODES_REVERSE = {v: k for k, v in FAN_MODES_FULL.items()}
-FAN_MODES_FAN_ONLY_REVERSE = {v: k for k, v in FAN_MODES_FAN_ONLY.items()}
@@ -7,6 +7,7 @@ import logging
 from functools import wraps
 
 # Bluetooth-related imports for device communication
+import orjson
 from bleak import BLEDevice
 from bleak.exc import BleakError
 from bleak_retry_connector import (
@@ -23,6 +24,11 @@ from .const import DOMAIN, UUIDS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keep the connection open this long after the last operation so that
+# follow-up commands and reads reuse it. The device only accepts a single
+# connection, so it is not held open between polls.
+DISCONNECT_DELAY = 30.0
+
 
 def retry_authentication(retries=3, delay=1):
     """Custom retry decorator for authentication attempts."""
@@ -55,7 +61,7 @@ def retry_authentication(retries=3, delay=1):
                         "Authentication attempt %d/%d failed: %s",
                         attempt + 1,
                         retries,
-                        str(e),
+                        e,
                     )
                     if attempt < retries - 1:
                         await asyncio.sleep(delay)
@@ -64,7 +70,7 @@ def retry_authentication(retries=3, delay=1):
                 _LOGGER.error(
                     "Authentication failed after %d attempts: %s",
                     retries,
-                    str(last_exception),
+                    last_exception,
                 )
             else:
                 _LOGGER.error(
@@ -106,6 +112,9 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
         self._ble_device = None
         self._max_delay = 6.0
         self._notification_task = None
+        self._disconnect_timer: asyncio.TimerHandle | None = None
+        # Serializes sessions on the shared client; the device allows one link
+        self._lock = asyncio.Lock()
 
     def _get_operation_delay(
         self, hass, address: str, operation: str
@@ -168,6 +177,49 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                     "Reset delay for %s:%s to 0.0s", address, operation
                 )
 
+    def _reset_disconnect_timer(self, hass) -> None:
+        """Schedule a disconnect once the connection has been idle."""
+        self._cancel_disconnect_timer()
+        self._disconnect_timer = hass.loop.call_later(
+            DISCONNECT_DELAY, self._disconnect_idle, hass
+        )
+
+    def _cancel_disconnect_timer(self) -> None:
+        """Cancel a pending idle disconnect."""
+        if self._disconnect_timer:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
+
+    def _disconnect_idle(self, hass) -> None:
+        """Disconnect after the idle delay has expired."""
+        self._disconnect_timer = None
+        hass.async_create_background_task(
+            self._async_disconnect_idle(), name=f"{DOMAIN}_idle_disconnect"
+        )
+
+    async def _async_disconnect_idle(self) -> None:
+        """Disconnect unless another session claimed the client meanwhile."""
+        async with self._lock:
+            if self._disconnect_timer is None:
+                await self.disconnect()
+
+    async def async_close(self) -> None:
+        """Disconnect once any in-flight session has finished."""
+        async with self._lock:
+            await self.disconnect()
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device and drop the client."""
+        self._cancel_disconnect_timer()
+        client = self._client
+        self._client = None
+        self._ble_device = None
+        try:
+            if client and client.is_connected:
+                await client.disconnect()
+        except Exception as e:
+            _LOGGER.debug("Error disconnecting: %s", e)
+
     def _start_update(self, service_info: BluetoothServiceInfo) -> None:
         """Update from BLE advertisement data."""
         _LOGGER.debug(
@@ -180,9 +232,13 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
         self.set_device_name(name)
         self.set_title(name)
 
-    def decrypt(self, data: bytes, zone: int = 0) -> dict:
+    def decrypt(self, data: bytes | str, zone: int = 0) -> dict:
         """Parse and decode the device status data for a specific zone."""
-        status = json.loads(data)
+        # json.loads decodes UTF-8 itself, so pass the GATT payload as read
+        return self.decrypt_parsed(json.loads(data), zone)
+
+    def decrypt_parsed(self, status: dict, zone: int = 0) -> dict:
+        """Decode already parsed device status data for a specific zone."""
         zone_key = str(zone)
 
         # Check if the requested zone exists
@@ -292,7 +348,7 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                 return False
             return self._client
         except Exception as e:
-            _LOGGER.error("Connection error: %s", str(e))
+            _LOGGER.error("Connection error: %s", e)
             raise
 
     @retry_authentication(retries=3, delay=2)
@@ -320,7 +376,7 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
             _LOGGER.debug("Authentication sent successfully")
             return True
         except Exception as e:
-            _LOGGER.error("Authentication failed: %s", str(e))
+            _LOGGER.error("Authentication failed: %s", e)
             if self._client and self._client.is_connected:
                 await self._client.disconnect()
             self._client = None
@@ -366,7 +422,7 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                     )
                     continue
         _LOGGER.error(
-            "GATT write failed after %d attempts: %s", retries, str(last_error)
+            "GATT write failed after %d attempts: %s", retries, last_error
         )
         return False
 
@@ -401,7 +457,7 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                 )
             return auth_result
         except Exception as e:
-            _LOGGER.error("Reconnection failed: %s", str(e))
+            _LOGGER.error("Reconnection failed: %s", e)
             self._increase_operation_delay(hass, ble_device.address, "connect")
             return False
 
@@ -409,7 +465,26 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
         self, hass, characteristic, ble_device: BLEDevice, retries: int = 3
     ) -> bytes | None:
         """Read GATT characteristic with retry and operation-specific delay."""
+        self._cancel_disconnect_timer()
         self._ble_device = ble_device
+        result = None
+        try:
+            result = await self._read_gatt_attempts(
+                hass, characteristic, ble_device, retries
+            )
+        finally:
+            # Never leave a failed link open without the idle timeout, the
+            # device accepts a single connection
+            if result is None:
+                await self.disconnect()
+            else:
+                self._reset_disconnect_timer(hass)
+        return result
+
+    async def _read_gatt_attempts(
+        self, hass, characteristic, ble_device: BLEDevice, retries: int
+    ) -> bytes | None:
+        """Try the GATT read up to retries times, reconnecting as needed."""
         last_error = None
         for attempt in range(retries):
             try:
@@ -440,20 +515,23 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                     )
                     continue
         _LOGGER.error(
-            "GATT read failed after %d attempts: %s", retries, str(last_error)
+            "GATT read failed after %d attempts: %s", retries, last_error
         )
         return None
 
     async def reboot_device(self, hass, ble_device: BLEDevice) -> bool:
         """Reboot the device by sending reset command."""
+        async with self._lock:
+            return await self._reboot_device(hass, ble_device)
+
+    async def _reboot_device(self, hass, ble_device: BLEDevice) -> bool:
+        """Reboot the device; the caller holds the session lock."""
+        # The link may still be open from the last poll, reuse it rather
+        # than opening a second connection the device would refuse
+        self._cancel_disconnect_timer()
         try:
-            self._ble_device = ble_device
-            self._client = await self._connect_to_device(ble_device)
-            if not self._client or not self._client.is_connected:
-                _LOGGER.error("Failed to connect for reboot")
-                return False
-            if not await self.authenticate(self._password):
-                _LOGGER.error("Failed to authenticate for reboot")
+            if not await self._ensure_connected(ble_device):
+                _LOGGER.error("Failed to connect and authenticate for reboot")
                 return False
             write_delay = self._get_operation_delay(
                 hass, ble_device.address, "write"
@@ -464,7 +542,7 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                 "Type": "Change",
                 "Changes": {"zone": 0, "reset": " OK"},
             }
-            cmd_bytes = json.dumps(reset_cmd).encode()
+            cmd_bytes = orjson.dumps(reset_cmd)
             try:
                 await self._client.write_gatt_char(
                     UUIDS["jsonCmd"], cmd_bytes, response=True
@@ -475,47 +553,66 @@ class MicroAirEasyTouchBluetoothDeviceData(BluetoothData):
                 if "Error" in str(e) and "133" in str(e):
                     _LOGGER.info("Device is rebooting as expected")
                     return True
-                _LOGGER.error("Failed to send reboot command: %s", str(e))
+                _LOGGER.error("Failed to send reboot command: %s", e)
                 self._increase_operation_delay(
                     hass, ble_device.address, "write"
                 )
                 return False
         except Exception as e:
-            _LOGGER.error("Error during reboot: %s", str(e))
+            _LOGGER.error("Error during reboot: %s", e)
             return False
         finally:
-            try:
-                if self._client and self._client.is_connected:
-                    await self._client.disconnect()
-            except Exception as e:
-                _LOGGER.debug("Error disconnecting after reboot: %s", str(e))
-            self._client = None
-            self._ble_device = None
+            await self.disconnect()
+
+    async def _ensure_connected(self, ble_device: BLEDevice) -> bool:
+        """Connect and authenticate unless a connection is already open."""
+        self._ble_device = ble_device
+        if self._client and self._client.is_connected:
+            return True
+        self._client = await self._connect_to_device(ble_device)
+        if not self._client or not self._client.is_connected:
+            return False
+        return await self.authenticate(self._password)
 
     async def send_command(
-        self, hass, ble_device: BLEDevice, command: dict
+        self, hass, ble_device: BLEDevice, command: dict | bytes
+    ) -> bool:
+        """Send command to device, accepting a dict or orjson bytes."""
+        async with self._lock:
+            return await self._send_command(hass, ble_device, command)
+
+    async def _send_command(
+        self, hass, ble_device: BLEDevice, command: dict | bytes
     ) -> bool:
-        """Send command to device."""
+        """Send a command; the caller holds the session lock."""
+        self._cancel_disconnect_timer()
+        result = False
         try:
-            self._ble_device = ble_device
-            if not self._client or not self._client.is_connected:
-                self._client = await self._connect_to_device(ble_device)
-                if not self._client or not self._client.is_connected:
-                    return False
-                if not await self.authenticate(self._password):
-                    return False
-            command_bytes = json.dumps(command).encode()
-            return await self._write_gatt_with_retry(
-                hass, UUIDS["jsonCmd"], command_bytes, ble_device
-            )
+            if await self._ensure_connected(ble_device):
+                # One serializer for every command keeps a single wire format
+                if isinstance(command, bytes):
+                    command_bytes = command
+                else:
+                    command_bytes = orjson.dumps(command)
+                result = await self._write_gatt_with_retry(
+                    hass, UUIDS["jsonCmd"], command_bytes, ble_device
+                )
         except Exception as e:
-            _LOGGER.error("Error sending command: %s", str(e))
-            return False
-        finally:
-            try:
-                if self._client and self._client.is_connected:
-                    await self._client.disconnect()
-            except Exception as e:
-                _LOGGER.debug("Error disconnecting: %s", str(e))
-            self._client = None
-            self._ble_device = None
+            _LOGGER.error("Error sending command: %s", e)
+        # Keep a healthy connection for follow-up reads, drop a failed one
+        if result:
+            self._reset_disconnect_timer(hass)
+        else:
+            await self.disconnect()
+        return result
+
+    async def send_command_and_read(
+        self, hass, ble_device: BLEDevice, command: dict | bytes
+    ) -> tuple[bool, bytes | None]:
+        """Send a command and read the reply as (sent, payload)."""
+        async with self._lock:
+            if not await self._send_command(hass, ble_device, command):
+                return False, None
+            return True, await self._read_gatt_with_retry(
+                hass, UUIDS["jsonReturn"], ble_device
+            )
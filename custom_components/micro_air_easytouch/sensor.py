@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import Final
 
+import orjson
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .device import device_info_for
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,33 +32,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MicroAirEasyTouch sensor platform."""
-    data = hass.data[DOMAIN][config_entry.entry_id]["data"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    data = config_entry.runtime_data.data
+    coordinator = config_entry.runtime_data.coordinator
     mac_address = config_entry.unique_id
 
     # Create sensors for zone 0 only
-    entities = [
-        MicroAirEasyTouchTemperatureSensor(
-            coordinator, data, mac_address, zone=0
-        ),
-        MicroAirEasyTouchCurrentModeSensor(
-            coordinator, data, mac_address, zone=0
-        ),
-        MicroAirEasyTouchCurrentFanModeSensor(
-            coordinator, data, mac_address, zone=0
-        ),
-        MicroAirEasyTouchSerialNumberSensor(
-            coordinator, data, mac_address, zone=0
-        ),
-        MicroAirEasyTouchRawInfoArraySensor(
-            coordinator, data, mac_address, zone=0
-        ),
-        MicroAirEasyTouchParametersSensor(
-            coordinator, data, mac_address, zone=0
-        ),
-    ]
-
-    async_add_entities(entities)
+    async_add_entities(
+        sensor_cls(coordinator, data, mac_address, zone=0)
+        for sensor_cls in (
+            MicroAirEasyTouchTemperatureSensor,
+            MicroAirEasyTouchCurrentModeSensor,
+            MicroAirEasyTouchCurrentFanModeSensor,
+            MicroAirEasyTouchSerialNumberSensor,
+            MicroAirEasyTouchRawInfoArraySensor,
+            MicroAirEasyTouchParametersSensor,
+        )
+    )
 
 
 class MicroAirEasyTouchSensorBase(CoordinatorEntity, SensorEntity):
@@ -75,60 +67,53 @@ class MicroAirEasyTouchSensorBase(CoordinatorEntity, SensorEntity):
         self._data = data
         self._mac_address = mac_address
         self._zone = zone
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"MicroAirEasyTouch_{mac_address}")},
-            name=f"EasyTouch {mac_address}",
-            manufacturer="Micro-Air",
-            model="Thermostat",
+        # Z_sts is keyed by the zone number as a string
+        self._zone_key = str(zone)
+        self._attr_unique_id = (
+            f"microaireasytouch_{mac_address}_{self.entity_description.key}"
         )
+        self._attr_device_info = device_info_for(mac_address)
 
 
 class MicroAirEasyTouchTemperatureSensor(MicroAirEasyTouchSensorBase):
     """Temperature sensor for MicroAirEasyTouch."""
 
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-
-    def __init__(
-        self,
-        coordinator,
-        data: MicroAirEasyTouchBluetoothDeviceData,
-        mac_address: str,
-        zone: int = 0,
-    ) -> None:
-        """Initialize the temperature sensor."""
-        super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = f"microaireasytouch_{mac_address}_temperature"
-        self._attr_name = "Temperature"
+    entity_description = SensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+    )
 
     @property
     def native_value(self) -> float | None:
         """Return the current temperature."""
         return self.coordinator.data.get("facePlateTemperature")
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:thermometer"
-
 
 class MicroAirEasyTouchCurrentModeSensor(MicroAirEasyTouchSensorBase):
     """Current mode sensor for MicroAirEasyTouch."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description = SensorEntityDescription(
+        key="current_mode",
+        name="Current Mode",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
-    def __init__(
-        self,
-        coordinator,
-        data: MicroAirEasyTouchBluetoothDeviceData,
-        mac_address: str,
-        zone: int = 0,
-    ) -> None:
-        """Initialize the current mode sensor."""
-        super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = f"microaireasytouch_{mac_address}_current_mode"
-        self._attr_name = "Current Mode"
+    _MODE_ICONS: Final = MappingProxyType(
+        {
+            "off": "mdi:power-off",
+            "fan": "mdi:fan",
+            "cool": "mdi:snowflake",
+            "cool_on": "mdi:snowflake",
+            "heat": "mdi:fire",
+            "heat_on": "mdi:fire",
+            "dry": "mdi:water-percent",
+            "auto": "mdi:autorenew",
+        }
+    )
 
     @property
     def native_value(self) -> str | None:
@@ -139,45 +124,22 @@ class MicroAirEasyTouchCurrentModeSensor(MicroAirEasyTouchSensorBase):
     def icon(self) -> str:
         """Return the icon based on current mode."""
         mode = self.coordinator.data.get("current_mode")
-        mode_icons = {
-            "off": "mdi:power-off",
-            "fan": "mdi:fan",
-            "cool": "mdi:snowflake",
-            "cool_on": "mdi:snowflake",
-            "heat": "mdi:fire",
-            "heat_on": "mdi:fire",
-            "dry": "mdi:water-percent",
-            "auto": "mdi:autorenew",
-        }
-        return mode_icons.get(mode, "mdi:thermostat")
+        return self._MODE_ICONS.get(mode, "mdi:thermostat")
 
 
 class MicroAirEasyTouchCurrentFanModeSensor(MicroAirEasyTouchSensorBase):
     """Current fan mode sensor for MicroAirEasyTouch."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description = SensorEntityDescription(
+        key="current_fan_mode",
+        name="Current Fan Mode",
+        icon="mdi:fan",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
-    def __init__(
-        self,
-        coordinator,
-        data: MicroAirEasyTouchBluetoothDeviceData,
-        mac_address: str,
-        zone: int = 0,
-    ) -> None:
-        """Initialize the current fan mode sensor."""
-        super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = (
-            f"microaireasytouch_{mac_address}_current_fan_mode"
-        )
-        self._attr_name = "Current Fan Mode"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the current fan mode based on current mode."""
-        current_mode = self.coordinator.data.get("mode", "off")
-
-        # Map fan modes from parser
-        fan_modes_full = {
+    # Map fan modes from parser
+    _FAN_MODES_FULL: Final = MappingProxyType(
+        {
             0: "off",
             1: "manual low",
             2: "manual high",
@@ -185,47 +147,41 @@ class MicroAirEasyTouchCurrentFanModeSensor(MicroAirEasyTouchSensorBase):
             66: "cycled high",
             128: "full auto",
         }
-        fan_modes_fan_only = {0: "off", 1: "low", 2: "high"}
-
-        if current_mode == "fan":
-            fan_mode_num = self.coordinator.data.get("fan_mode_num", 0)
-            return fan_modes_fan_only.get(fan_mode_num, "unknown")
-        elif current_mode == "cool":
-            fan_mode_num = self.coordinator.data.get("cool_fan_mode_num", 128)
-            return fan_modes_full.get(fan_mode_num, "unknown")
-        elif current_mode == "heat":
-            fan_mode_num = self.coordinator.data.get("heat_fan_mode_num", 128)
-            return fan_modes_full.get(fan_mode_num, "unknown")
-        elif current_mode == "auto":
-            fan_mode_num = self.coordinator.data.get("auto_fan_mode_num", 128)
-            return fan_modes_full.get(fan_mode_num, "unknown")
-        elif current_mode == "dry":
-            fan_mode_num = self.coordinator.data.get("dry_fan_mode_num", 128)
-            return fan_modes_full.get(fan_mode_num, "unknown")
-        return "off"
+    )
+    _FAN_MODES_FAN_ONLY: Final = MappingProxyType(
+        {0: "off", 1: "low", 2: "high"}
+    )
+    # Mode -> (state key, default fan number, fan name table)
+    _FAN_DISPATCH: Final = MappingProxyType(
+        {
+            "fan": ("fan_mode_num", 0, _FAN_MODES_FAN_ONLY),
+            "cool": ("cool_fan_mode_num", 128, _FAN_MODES_FULL),
+            "heat": ("heat_fan_mode_num", 128, _FAN_MODES_FULL),
+            "auto": ("auto_fan_mode_num", 128, _FAN_MODES_FULL),
+            "dry": ("dry_fan_mode_num", 128, _FAN_MODES_FULL),
+        }
+    )
 
     @property
-    def icon(self) -> str:
-        """Return the icon based on fan mode."""
-        return "mdi:fan"
+    def native_value(self) -> str | None:
+        """Return the current fan mode based on current mode."""
+        data = self.coordinator.data
+        entry = self._FAN_DISPATCH.get(data.get("mode", "off"))
+        if entry is None:
+            return "off"
+        key, default, names = entry
+        return names.get(data.get(key, default), "unknown")
 
 
 class MicroAirEasyTouchSerialNumberSensor(MicroAirEasyTouchSensorBase):
     """Serial number sensor for MicroAirEasyTouch."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Serial Number"
-
-    def __init__(
-        self,
-        coordinator,
-        data: MicroAirEasyTouchBluetoothDeviceData,
-        mac_address: str,
-        zone: int = 0,
-    ) -> None:
-        """Initialize the serial number sensor."""
-        super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = f"microaireasytouch_{mac_address}_serial_number"
+    entity_description = SensorEntityDescription(
+        key="serial_number",
+        name="Serial Number",
+        icon="mdi:identifier",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self) -> str | None:
@@ -233,17 +189,35 @@ class MicroAirEasyTouchSerialNumberSensor(MicroAirEasyTouchSensorBase):
         sn = self.coordinator.data.get("SN")
         return str(sn) if sn is not None else None
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:identifier"
-
 
 class MicroAirEasyTouchRawInfoArraySensor(MicroAirEasyTouchSensorBase):
     """Raw info array sensor for MicroAirEasyTouch."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Raw Info Array"
+    entity_description = SensorEntityDescription(
+        key="raw_info_array",
+        name="Raw Info Array",
+        icon="mdi:code-array",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
+
+    _INFO_KEYS: Final = (
+        "info_0_autoHeat_sp",
+        "info_1_autoCool_sp",
+        "info_2_cool_sp",
+        "info_3_heat_sp",
+        "info_4_dry_sp",
+        "info_5_dry_fan",
+        "info_6_fan_mode",
+        "info_7_cool_fan",
+        "info_8_unknown",
+        "info_9_auto_fan",
+        "info_10_mode_num",
+        "info_11_heat_fan",
+        "info_12_temperature",
+        "info_13_unknown",
+        "info_14_unknown",
+        "info_15_current_mode",
+    )
 
     def __init__(
         self,
@@ -252,59 +226,49 @@ class MicroAirEasyTouchRawInfoArraySensor(MicroAirEasyTouchSensorBase):
         mac_address: str,
         zone: int = 0,
     ) -> None:
-        """Initialize the raw info array sensor."""
+        """Initialize the sensor and derive its initial state."""
         super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = (
-            f"microaireasytouch_{mac_address}_raw_info_array"
-        )
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Derive the zone's info array state once per coordinator update."""
+        all_data = self.coordinator.data.get("ALL") or {}
+        info = all_data.get("Z_sts", {}).get(self._zone_key)
+        if info is not None:
+            self._cached_json = orjson.dumps(info).decode()
+            # Indices the device did not send are reported as None
+            self._cached_attrs = dict(
+                zip(self._INFO_KEYS, chain(info, repeat(None)))
+            )
+        else:
+            self._cached_json = None
+            self._cached_attrs = {}
+
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
         """Return the raw info array as JSON."""
-        all_data = self.coordinator.data.get("ALL")
-        zone_key = str(self._zone)
-        if all_data and "Z_sts" in all_data and zone_key in all_data["Z_sts"]:
-            return json.dumps(all_data["Z_sts"][zone_key])
-        return None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:code-array"
+        return self._cached_json
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes with parsed info array indices."""
-        all_data = self.coordinator.data.get("ALL")
-        zone_key = str(self._zone)
-        if all_data and "Z_sts" in all_data and zone_key in all_data["Z_sts"]:
-            info = all_data["Z_sts"][zone_key]
-            return {
-                "info_0_autoHeat_sp": info[0] if len(info) > 0 else None,
-                "info_1_autoCool_sp": info[1] if len(info) > 1 else None,
-                "info_2_cool_sp": info[2] if len(info) > 2 else None,
-                "info_3_heat_sp": info[3] if len(info) > 3 else None,
-                "info_4_dry_sp": info[4] if len(info) > 4 else None,
-                "info_5_dry_fan": info[5] if len(info) > 5 else None,
-                "info_6_fan_mode": info[6] if len(info) > 6 else None,
-                "info_7_cool_fan": info[7] if len(info) > 7 else None,
-                "info_8_unknown": info[8] if len(info) > 8 else None,
-                "info_9_auto_fan": info[9] if len(info) > 9 else None,
-                "info_10_mode_num": info[10] if len(info) > 10 else None,
-                "info_11_heat_fan": info[11] if len(info) > 11 else None,
-                "info_12_temperature": info[12] if len(info) > 12 else None,
-                "info_13_unknown": info[13] if len(info) > 13 else None,
-                "info_14_unknown": info[14] if len(info) > 14 else None,
-                "info_15_current_mode": (info[15] if len(info) > 15 else None),
-            }
-        return {}
+        return self._cached_attrs
 
 
 class MicroAirEasyTouchParametersSensor(MicroAirEasyTouchSensorBase):
     """Parameters sensor for MicroAirEasyTouch."""
 
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_name = "Parameters"
+    entity_description = SensorEntityDescription(
+        key="parameters",
+        name="Parameters",
+        icon="mdi:tune",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     def __init__(
         self,
@@ -313,36 +277,39 @@ class MicroAirEasyTouchParametersSensor(MicroAirEasyTouchSensorBase):
         mac_address: str,
         zone: int = 0,
     ) -> None:
-        """Initialize the parameters sensor."""
+        """Initialize the sensor and derive its initial state."""
         super().__init__(coordinator, data, mac_address, zone)
-        self._attr_unique_id = f"microaireasytouch_{mac_address}_parameters"
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Derive the parameters state once per coordinator update."""
+        try:
+            prm = self.coordinator.data["ALL"]["PRM"]
+        except (KeyError, TypeError):
+            self._cached_json = None
+            self._cached_attrs = {}
+            return
+        self._cached_json = orjson.dumps(prm).decode()
+        attrs = {f"param_{idx}": val for idx, val in enumerate(prm)}
+        # Add interpreted values based on documentation
+        flags = set(prm)
+        if 7 in flags:
+            attrs["power_off_indicated"] = True
+        if 15 in flags:
+            attrs["power_on_indicated"] = True
+        self._cached_attrs = attrs
+
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
         """Return the parameters as JSON."""
-        all_data = self.coordinator.data.get("ALL")
-        if all_data and "PRM" in all_data:
-            return json.dumps(all_data["PRM"])
-        return None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:tune"
+        return self._cached_json
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes with parameter values."""
-        all_data = self.coordinator.data.get("ALL")
-        if all_data and "PRM" in all_data:
-            prm = all_data["PRM"]
-            attrs = {}
-            for idx, val in enumerate(prm):
-                attrs[f"param_{idx}"] = val
-            # Add interpreted values based on documentation
-            if 7 in prm:
-                attrs["power_off_indicated"] = True
-            if 15 in prm:
-                attrs["power_on_indicated"] = True
-            return attrs
-        return {}
+        return self._cached_attrs
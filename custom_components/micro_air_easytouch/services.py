@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import time
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.components.bluetooth import async_ble_device_from_address
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 
 from .const import DOMAIN
+from .micro_air_easytouch.const import UUIDS
 from .micro_air_easytouch.parser import MicroAirEasyTouchBluetoothDeviceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,6 +38,27 @@ SERVICE_QUERY_DEVICE_SCHEMA = vol.Schema(
 )
 
 
+@callback
+def _async_get_loaded_entry(
+    hass: HomeAssistant, address: str
+) -> ConfigEntry | None:
+    """Return the loaded config entry for a MAC address, logging misses."""
+    # Config entries are indexed by (domain, unique_id), no scan needed
+    config_entry = hass.config_entries.async_entry_for_domain_unique_id(
+        DOMAIN, address
+    )
+    if config_entry is None:
+        _LOGGER.error(
+            "No MicroAirEasyTouch config entry found for address %s",
+            address,
+        )
+        return None
+    if config_entry.state is not ConfigEntryState.LOADED:
+        _LOGGER.error("MicroAirEasyTouch device %s is not loaded", address)
+        return None
+    return config_entry
+
+
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register services for the MicroAirEasyTouch integration."""
 
@@ -44,27 +68,25 @@ async def async_register_services(hass: HomeAssistant) -> None:
         latitude = call.data.get("latitude")
         longitude = call.data.get("longitude")
 
-        # Find the config entry by MAC address (unique_id)
-        config_entry = None
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.unique_id == address:
-                config_entry = entry
-                break
-
-        if not config_entry:
-            _LOGGER.error(
-                "No MicroAirEasyTouch config entry found for address %s",
-                address,
-            )
+        config_entry = _async_get_loaded_entry(hass, address)
+        if config_entry is None:
             return
 
         # Get the device data
-        device_data: MicroAirEasyTouchBluetoothDeviceData = hass.data[DOMAIN][
-            config_entry.entry_id
-        ]["data"]
+        runtime_data = config_entry.runtime_data
+        device_data: MicroAirEasyTouchBluetoothDeviceData = runtime_data.data
         mac_address = config_entry.unique_id
         assert mac_address is not None
 
+        # Automations often repeat the same position, skip the BLE exchange
+        location = (f"{latitude:.5f}", f"{longitude:.5f}")
+        if location == runtime_data.last_location:
+            _LOGGER.info(
+                "Location for device %s is unchanged, not resending",
+                mac_address,
+            )
+            return
+
         # Get BLE device
         ble_device = async_ble_device_from_address(hass, mac_address)
         if not ble_device:
@@ -77,15 +99,16 @@ async def async_register_services(hass: HomeAssistant) -> None:
         command = {
             "Type": "Get Status",
             "Zone": 0,
-            "LAT": f"{latitude:.5f}",
-            "LON": f"{longitude:.5f}",
-            "TM": int(time.time()),
+            "LAT": location[0],
+            "LON": location[1],
+            "TM": time.time_ns() // 1_000_000_000,
         }
 
         # Send the command
         try:
             success = await device_data.send_command(hass, ble_device, command)
             if success:
+                runtime_data.last_location = location
                 _LOGGER.info(
                     "Successfully sent location (LAT: %s, LON: %s) to device %s",
                     latitude,
@@ -100,31 +123,30 @@ async def async_register_services(hass: HomeAssistant) -> None:
             _LOGGER.error(
                 "Error sending location command to device %s: %s",
                 mac_address,
-                str(e),
+                e,
             )
 
     async def handle_query_device(call: ServiceCall) -> None:
         """Handle the query_device service call to discover all available data."""
         address = call.data.get("address")
 
-        # Find the config entry by MAC address (unique_id)
-        config_entry = None
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.unique_id == address:
-                config_entry = entry
-                break
+        config_entry = _async_get_loaded_entry(hass, address)
+        if config_entry is None:
+            return
 
-        if not config_entry:
-            _LOGGER.error(
-                "No MicroAirEasyTouch config entry found for address %s",
-                address,
+        # The report is logged at INFO, skip the BLE exchange if it would
+        # be filtered out anyway
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.warning(
+                "query_device logs at INFO level, enable it for %s",
+                __name__,
             )
             return
 
         # Get the device data
-        device_data: MicroAirEasyTouchBluetoothDeviceData = hass.data[DOMAIN][
-            config_entry.entry_id
-        ]["data"]
+        device_data: MicroAirEasyTouchBluetoothDeviceData = (
+            config_entry.runtime_data.data
+        )
         mac_address = config_entry.unique_id
         assert mac_address is not None
 
@@ -141,62 +163,60 @@ async def async_register_services(hass: HomeAssistant) -> None:
             "Type": "Get Status",
             "Zone": 0,
             "EM": device_data._email,
-            "TM": int(time.time()),
+            "TM": time.time_ns() // 1_000_000_000,
         }
 
         try:
             _LOGGER.info(
                 "=== Querying device %s for all available data ===", address
             )
-            if await device_data.send_command(hass, ble_device, command):
-                from .micro_air_easytouch.const import UUIDS
-
-                json_payload = await device_data._read_gatt_with_retry(
-                    hass, UUIDS["jsonReturn"], ble_device
+            sent, json_payload = await device_data.send_command_and_read(
+                hass, ble_device, command
+            )
+            if not sent:
+                _LOGGER.error("Failed to send query command to device")
+            elif not json_payload:
+                _LOGGER.error("No response received from device")
+            else:
+                raw_data = json.loads(json_payload)
+                parsed_data = device_data.decrypt_parsed(raw_data)
+
+                # Build the dump as one record so it is not interleaved
+                lines = [
+                    "RAW DEVICE RESPONSE:",
+                    f"  Full JSON: {json.dumps(raw_data, indent=2)}",
+                    "",
+                    "PARSED DATA:",
+                ]
+                lines.extend(
+                    f"  {key}: {value}"
+                    for key, value in parsed_data.items()
+                    if key != "ALL"
                 )
-                if json_payload:
-                    import json
-
-                    raw_data = json.loads(json_payload.decode("utf-8"))
-                    parsed_data = device_data.decrypt(
-                        json_payload.decode("utf-8")
+                lines += ["", "RAW INFO ARRAY (Z_sts['0']):"]
+                if "Z_sts" in raw_data and "0" in raw_data["Z_sts"]:
+                    lines.extend(
+                        f"  info[{idx}] = {val}"
+                        for idx, val in enumerate(raw_data["Z_sts"]["0"])
                     )
-
-                    _LOGGER.info("RAW DEVICE RESPONSE:")
-                    _LOGGER.info(
-                        "  Full JSON: %s", json.dumps(raw_data, indent=2)
+                lines += ["", "PARAMETERS (PRM):"]
+                if "PRM" in raw_data:
+                    lines.append(f"  {raw_data['PRM']}")
+                lines += ["", "BLUETOOTH UUIDs available:"]
+                lines.extend(
+                    f"  {name}: {UUIDS[name]}"
+                    for name in (
+                        "service",
+                        "passwordCmd",
+                        "jsonCmd",
+                        "jsonReturn",
+                        "unknown",
                     )
-                    _LOGGER.info("")
-                    _LOGGER.info("PARSED DATA:")
-                    for key, value in parsed_data.items():
-                        if key != "ALL":
-                            _LOGGER.info("  %s: %s", key, value)
-                    _LOGGER.info("")
-                    _LOGGER.info("RAW INFO ARRAY (Z_sts['0']):")
-                    if "Z_sts" in raw_data and "0" in raw_data["Z_sts"]:
-                        info_array = raw_data["Z_sts"]["0"]
-                        for idx, val in enumerate(info_array):
-                            _LOGGER.info("  info[%d] = %s", idx, val)
-                    _LOGGER.info("")
-                    _LOGGER.info("PARAMETERS (PRM):")
-                    if "PRM" in raw_data:
-                        _LOGGER.info("  %s", raw_data["PRM"])
-                    _LOGGER.info("")
-                    _LOGGER.info("BLUETOOTH UUIDs available:")
-                    _LOGGER.info("  service: %s", UUIDS["service"])
-                    _LOGGER.info("  passwordCmd: %s", UUIDS["passwordCmd"])
-                    _LOGGER.info("  jsonCmd: %s", UUIDS["jsonCmd"])
-                    _LOGGER.info("  jsonReturn: %s", UUIDS["jsonReturn"])
-                    _LOGGER.info("  unknown: %s", UUIDS["unknown"])
-                    _LOGGER.info(
-                        "=============================================="
-                    )
-                else:
-                    _LOGGER.error("No response received from device")
-            else:
-                _LOGGER.error("Failed to send query command to device")
+                )
+                lines.append("==============================================")
+                _LOGGER.info("\n".join(lines))
         except Exception as e:
-            _LOGGER.error("Error querying device %s: %s", mac_address, str(e))
+            _LOGGER.error("Error querying device %s: %s", mac_address, e)
 
     # Register each service only if not already registered
     if not hass.services.has_service(DOMAIN, "set_location"):
@@ -214,9 +234,3 @@ async def async_register_services(hass: HomeAssistant) -> None:
             handle_query_device,
             schema=SERVICE_QUERY_DEVICE_SCHEMA,
         )
-
-
-async def async_unregister_services(hass: HomeAssistant) -> None:
-    """Unregister services for the MicroAirEasyTouch integration."""
-    hass.services.async_remove(DOMAIN, "set_location")
-    hass.services.async_remove(DOMAIN, "query_device")